@@ -1,73 +1,351 @@
-from langchain.chains import LLMChain
-from langchain.memory import ConversationBufferMemory
-from langchain_groq import ChatGroq
-from langchain_openai import ChatOpenAI
-from langchain.schema.output_parser import BaseOutputParser  # ✅ correct
+# LangChain and the provider SDKs are imported lazily inside the methods
+# that need them so that importing this module (and rendering the first
+# page) stays cheap on a cold start.
+import hashlib
+import math
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+import streamlit as st
+from typing import Any, Dict, Iterator, List, Match, Optional, Tuple
 
+import prompts
+
+# Rough output tokens per word of Hinglish text, per provider tokenizer
+TOKENS_PER_WORD = {
+    "groq": 1.6,
+    "openai": 1.7,
+    "local": 1.8,
+}
+
+# Headroom over the word budget before the hard token cap cuts in, so the
+# streaming guard normally gets to finish the sentence first
+TOKEN_BUDGET_HEADROOM = 1.3
+
+# Stop as soon as the model starts echoing the prompt scaffolding
+SPEECH_STOP_SEQUENCES = ["\nCritique:", "\nTopic:", "\nParameters:", "\nSpeech:"]
+
+# SpeechGenerator is created per request, so cache totals are process-wide
+_prompt_cache_totals = {
+    "calls": 0,
+    "reported_calls": 0,
+    "prompt_tokens": 0,
+    "cached_tokens": 0,
+}
+_prompt_cache_totals_lock = threading.Lock()
+
+# Speech length guard totals, process-wide for the same reason
+_generation_totals = {
+    "speeches": 0,
+    "truncated": 0,
+    "words": 0,
+}
+_generation_totals_lock = threading.Lock()
+
+# Provider SDK errors (openai, groq, httpx) that mean the service was
+# unreachable rather than that the request was wrong
+_TRANSIENT_ERROR_NAMES = {
+    "APIConnectionError", "APITimeoutError", "ConnectError", "ConnectTimeout",
+    "ReadTimeout", "TimeoutException", "InternalServerError", "ServiceUnavailableError",
+}
+
+# Set once loading the local fallback model fails, so later calls skip it
+_fallback_load_failed = False
+
+_SENTENCE_END = re.compile(r"[.!?\u0964]+[\"')\]]*(?=\s|$)")
+# A full stop after these does not end a sentence ("Rs. 5 crore", "Dr. Sharma");
+# "No." only counts as one when a number follows
+_ABBREVIATIONS = frozenset(["rs", "dr", "mr", "mrs", "ms", "prof", "sh", "shri", "smt", "st", "vs"])
+_WORD_BEFORE = re.compile(r"(\w+)$")
+_NUMBER_AFTER = re.compile(r"\s*\d")
+
+
+def speech_token_budget(provider: str, max_words: int) -> int:
+    """Output token cap for a speech of at most max_words words"""
+    return math.ceil(max_words * TOKENS_PER_WORD.get(provider, 1.8) * TOKEN_BUDGET_HEADROOM)
 
-from prompts import speech_prompt, critique_prompt, topic_summarizer_prompt
-import streamlit as st
-import os
-from typing import Optional, Dict, Any
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Whether a provider error is a connection, timeout or 5xx failure.
+
+    Only these fall back to the local model; authentication, quota and bad
+    request errors are surfaced to the user.
+    """
+    if isinstance(exc, (ConnectionError, TimeoutError, FutureTimeoutError)):
+        return True
+    if any(cls.__name__ in _TRANSIENT_ERROR_NAMES for cls in type(exc).__mro__):
+        return True
+    status_code = getattr(exc, "status_code", None)
+    return isinstance(status_code, int) and status_code >= 500
+
+
+def _sentence_ends(text: str, start: int = 0) -> Iterator[Match[str]]:
+    """Sentence boundaries in text from start, skipping abbreviations"""
+    for match in _SENTENCE_END.finditer(text, start):
+        if match.group() == ".":
+            word = _WORD_BEFORE.search(text, max(0, match.start() - 5), match.start())
+            if word:
+                word = word.group(1).lower()
+                if word in _ABBREVIATIONS or (word == "no" and _NUMBER_AFTER.match(text, match.end())):
+                    continue
+        yield match
+
+
+def cut_at_sentence(text: str, max_words: int, final: bool = True, hit_token_cap: bool = False,
+                    min_words: int = prompts.SPEECH_MIN_WORDS) -> Tuple[str, bool]:
+    """Trim text to the first sentence boundary at or after max_words words.
+
+    Returns (text, cut). While streaming (final=False) text past the budget
+    is kept until a boundary arrives. On the final text, an unfinished last
+    sentence is only trimmed when generation hit the hard token cap, and
+    never below min_words; a speech that ended on its own is kept as is.
+    """
+    words = list(re.finditer(r"\S+", text))
+    if len(words) > max_words:
+        budget_end = words[max_words - 1].start()
+        boundary = next(_sentence_ends(text, budget_end), None)
+        if boundary:
+            return text[:boundary.end()].rstrip(), boundary.end() < len(text.rstrip())
+    if not final or not hit_token_cap:
+        return text, False
+
+    last = None
+    for last in _sentence_ends(text):
+        pass
+    if last and last.end() < len(text.rstrip()):
+        kept_words = sum(1 for word in words if word.start() < last.end())
+        if kept_words >= min_words:
+            return text[:last.end()].rstrip(), True
+    return text, False
+
+
+def hit_token_cap(response) -> bool:
+    """Whether a response (or final stream chunk) stopped at max_tokens"""
+    metadata = getattr(response, "response_metadata", None) or {}
+    reason = metadata.get("finish_reason") or metadata.get("stop_reason")
+    return reason in ("length", "max_tokens")
 
 class SpeechGenerator:
-    def __init__(self, api_key: str, model_provider: str = "groq"):
+    def __init__(self, api_key: str, model_provider: str = "groq", batch_critiques: bool = False,
+                 local_critique: bool = False, max_words: int = prompts.SPEECH_MAX_WORDS):
         self.api_key = api_key
         self.model_provider = model_provider
+        self.max_words = max_words
+        self.batch_critiques = batch_critiques
+        self.local_critique = local_critique
         self.llm = self._initialize_llm()
-        self.memory = ConversationBufferMemory(
-            memory_key="chat_history",
-            return_messages=True
-        )
+        self._fallback_llm = None
+        # Latest usage per prompt name, e.g. "speech_prompt", "critique_prompt"
+        self.last_prompt_stats: Dict[str, Dict[str, Any]] = {}
         
     def _initialize_llm(self):
          if self.model_provider == "groq":
+            from langchain_groq import ChatGroq
             return ChatGroq(
             api_key=self.api_key,  # Changed from groq_api_key
             model="llama3-70b-8192",  # Changed from model_name
             temperature=0.8
         )
          elif self.model_provider == "openai":
+             from langchain_openai import ChatOpenAI
              return ChatOpenAI(
             api_key=self.api_key,  # Changed from openai_api_key
             model="gpt-3.5-turbo",  # Changed from model_name
+            temperature=0.8,
+            stream_usage=True  # Report token usage (and cache hits) when streaming
+        )
+         elif self.model_provider == "local":
+             from local_llm import LocalChatModel
+             return LocalChatModel(  # Model path comes from LOCAL_MODEL_PATH only
             temperature=0.8
         )
+
+    def _get_fallback_llm(self, error: Exception):
+        """Local model to use after a transient remote failure, or None.
+
+        Returns None for non-transient errors, when no local model is
+        configured, or when it failed to load (remembered for the process),
+        so callers re-raise the original provider error.
+        """
+        global _fallback_load_failed
+        if self.model_provider == "local" or _fallback_load_failed or not is_transient_error(error):
+            return None
+        if self._fallback_llm is None:
+            from local_llm import get_local_model_path, LocalChatModel
+            if get_local_model_path() is None:
+                return None
+            try:
+                self._fallback_llm = LocalChatModel(temperature=0.8)
+            except Exception:
+                _fallback_load_failed = True
+                return None
+        st.info(f"{self.model_provider} is unavailable ({type(error).__name__}); "
+                "used the local model instead.")
+        return self._fallback_llm
+
+    def _run_prompt(self, prompt_name: str, **variables) -> str:
+        """Send a compiled prompt to the model and return the response text.
+
+        The static instructions go out as the system message ahead of the
+        per-call request, so repeated calls share a cacheable prefix.
+        """
+        prompt = getattr(prompts, prompt_name)
+        messages = prompt.to_messages(**variables)
+        try:
+            response = self.llm.invoke(messages)
+        except Exception as e:
+            fallback_llm = self._get_fallback_llm(e)
+            if fallback_llm is None:
+                raise
+            response = fallback_llm.invoke(messages)
+        self._record_prompt_cache_usage(prompt_name, response)
+        return response.content
+
+    def _record_prompt_cache_usage(self, prompt_name: str, response) -> None:
+        """Record prompt-prefix cache hits where the provider reports them.
+
+        response is None when the call returned no usage at all (a stream
+        stopped early); the prompt's entry then shows None and the process
+        totals are left alone.
+        """
+        prompt_tokens, cached_tokens = (
+            extract_prompt_cache_usage(response) if response is not None else (None, None)
+        )
+        self.last_prompt_stats[prompt_name] = {
+            "prompt_tokens": prompt_tokens,
+            "cached_tokens": cached_tokens,
+        }
+        if response is not None:
+            _add_prompt_cache_usage(prompt_tokens, cached_tokens)
+
     def generate_speech(self, topic: str, tone: int, blame: str, freebies: int, 
                    hindutva: int, development: int) -> str:
         try:
-            speech_chain = LLMChain(
-                 llm=self.llm,
-                prompt=speech_prompt,
-                output_key="speech"
-        )
-        
-            result = speech_chain.invoke({  # Use invoke instead of run
-                "topic": topic,
-                "tone": tone,
-                "blame": blame,
-                "freebies": freebies,
-                "hindutva": hindutva,
-                "development": development
-        })
-        
-            return result["speech"]
+            return self._generate_speech_text(
+                topic=topic,
+                tone=tone,
+                blame=blame,
+                freebies=freebies,
+                hindutva=hindutva,
+                development=development
+            )
         except Exception as e:
-         st.error(f"Error generating speech: {e}")
-        return "Error generating speech. Please try again."
+            st.error(f"Error generating speech: {e}")
+            return "Error generating speech. Please try again."
     
 
+    def _generation_kwargs(self, provider: str) -> Dict[str, Any]:
+        return {
+            "stop": SPEECH_STOP_SEQUENCES,
+            "max_tokens": speech_token_budget(provider, self.max_words),
+        }
+
+    def _stream_speech(self, llm, provider: str, messages) -> Tuple[str, bool, Any]:
+        """Stream a speech, stopping at a sentence boundary once over budget.
+
+        Returns (speech, truncated, usage_chunk) where usage_chunk is the
+        chunk carrying token usage, or None if the provider sent none.
+        """
+        pieces: List[str] = []
+        usage_chunk = None
+        capped = False
+        stream = llm.stream(messages, **self._generation_kwargs(provider))
+        try:
+            for chunk in stream:
+                pieces.append(chunk.content)
+                capped = capped or hit_token_cap(chunk)
+                if extract_prompt_cache_usage(chunk)[0] is not None:
+                    usage_chunk = chunk
+                text, cut = cut_at_sentence("".join(pieces), self.max_words, final=False)
+                if cut:
+                    return text, True, usage_chunk
+        finally:
+            # Closing the stream stops generation on the provider side
+            if hasattr(stream, "close"):
+                stream.close()
+
+        # Generation ended on its own or at the hard token cap
+        return cut_at_sentence("".join(pieces), self.max_words, hit_token_cap=capped) + (usage_chunk,)
+
+    def _generate_speech_text(self, **variables) -> str:
+        """Generate a speech within the word budget and record truncation"""
+        messages = prompts.speech_prompt.to_messages(**variables)
+        try:
+            speech, truncated, usage_chunk = self._stream_speech(self.llm, self.model_provider, messages)
+        except Exception as e:
+            fallback_llm = self._get_fallback_llm(e)
+            if fallback_llm is None:
+                raise
+            speech, truncated, usage_chunk = self._stream_speech(fallback_llm, "local", messages)
+
+        # A stream stopped early by the guard carries no usage (None); the
+        # prompt still gets an entry but the process totals are not touched
+        self._record_prompt_cache_usage("speech_prompt", usage_chunk)
+        self._record_generation(speech, truncated)
+        return speech
+
+    def _record_generation(self, speech: str, truncated: bool) -> None:
+        with _generation_totals_lock:
+            _generation_totals["speeches"] += 1
+            _generation_totals["words"] += len(speech.split())
+            if truncated:
+                _generation_totals["truncated"] += 1
+
+    def generate_speech_batch(self, requests: List[Dict[str, Any]]) -> List[str]:
+        """Generate speeches for many parameter sets, e.g. for pre-generation jobs.
+
+        Each request holds the generate_speech keyword arguments. Remote
+        providers run the batch concurrently; the local model runs the
+        prompts one after another, taking its lock per prompt so interactive
+        sessions can interleave with the job.
+        """
+        inputs = [prompts.speech_prompt.to_messages(**request) for request in requests]
+        responses = self.llm.batch(inputs, **self._generation_kwargs(self.model_provider))
+        speeches = []
+        for response in responses:
+            self._record_prompt_cache_usage("speech_prompt", response)
+            speech, truncated = cut_at_sentence(
+                response.content, self.max_words, hit_token_cap=hit_token_cap(response)
+            )
+            self._record_generation(speech, truncated)
+            speeches.append(speech)
+        return speeches
+
+    def _critique(self, speech: str, blame: Optional[str] = None) -> str:
+        if self.local_critique:
+            # Deterministic scoring only, skipping the second LLM call
+            from speech_analyzer import analyze_speech, format_local_critique
+            return format_local_critique(analyze_speech(speech, blame))
+        if self.batch_critiques:
+            future = submit_critique(self.model_provider, self.api_key, self.llm, speech)
+            return self._await_critique(future, speech)
+        return self._run_prompt("critique_prompt", speech=speech)
+
+    def _await_critique(self, future: Future, speech: str) -> str:
+        """Wait for a batched critique, falling back to the local model on a transient failure"""
+        try:
+            return future.result(timeout=CRITIQUE_TIMEOUT_SECONDS)
+        except Exception as e:
+            fallback_llm = self._get_fallback_llm(e)
+            if fallback_llm is None:
+                raise
+            return fallback_llm.invoke(prompts.critique_prompt.to_messages(speech=speech)).content
+
+    def critique_speeches(self, speeches: List[str]) -> List[str]:
+        """Critique many speeches, packing several into each LLM call"""
+        futures = [
+            submit_critique(self.model_provider, self.api_key, self.llm, speech)
+            for speech in speeches
+        ]
+        return [self._await_critique(future, speech) for future, speech in zip(futures, speeches)]
+
     def critique_speech(self, speech: str) -> str:
         """Generate critique of the speech"""
         try:
-            critique_chain = LLMChain(
-                llm=self.llm,
-                prompt=critique_prompt,
-                output_key="critique"
-            )
-            
-            result = critique_chain.invoke({"speech": speech})
-            return result["critique"]
+            return self._critique(speech)
         except Exception as e:
             st.error(f"Error generating critique: {e}")
             return "Error generating critique. Please try again."
@@ -76,36 +354,21 @@ class SpeechGenerator:
     def generate_speech_and_critique(self, topic: str, tone: int, blame: str, 
                                 freebies: int, hindutva: int, development: int) -> Dict[str, str]:
         try:
-            # Add timeout and retry logic
-            speech_chain = LLMChain(
-                llm=self.llm,
-                prompt=speech_prompt,
-                output_key="speech"
-            )
-            
-            critique_chain = LLMChain(
-                llm=self.llm,
-                prompt=critique_prompt,
-                output_key="critique"
-            )
-            
             # Sequential execution with error handling
-            speech_result = speech_chain.invoke({
-                "topic": topic,
-                "tone": tone,
-                "blame": blame,
-                "freebies": freebies,
-                "hindutva": hindutva,
-                "development": development
-            })
+            speech = self._generate_speech_text(
+                topic=topic,
+                tone=tone,
+                blame=blame,
+                freebies=freebies,
+                hindutva=hindutva,
+                development=development
+            )
             
-            critique_result = critique_chain.invoke({
-                "speech": speech_result["speech"]
-            })
+            critique = self._critique(speech, blame)
             
             return {
-                "speech": speech_result["speech"],
-                "critique": critique_result["critique"]
+                "speech": speech,
+                "critique": critique
             }
             
         except Exception as e:
@@ -117,27 +380,203 @@ class SpeechGenerator:
     def summarize_topics(self, headlines: str) -> str:
         """Summarize news headlines into topics"""
         try:
-            topic_chain = LLMChain(
-                llm=self.llm,
-                prompt=topic_summarizer_prompt,
-                output_key="topics"
-            )
-            
-            result = topic_chain.invoke({"headlines": headlines})
-            return result["topics"]
+            return self._run_prompt("topic_summarizer_prompt", headlines=headlines)
         except Exception as e:
             st.error(f"Error summarizing topics: {e}")
             return ""
 
+
+def get_prompt_cache_stats() -> Dict[str, int]:
+    """Prompt-prefix cache totals across every SpeechGenerator in the process"""
+    with _prompt_cache_totals_lock:
+        return dict(_prompt_cache_totals)
+
+
+def get_generation_stats() -> Dict[str, int]:
+    """Speech count, truncations and words across every SpeechGenerator in the process"""
+    with _generation_totals_lock:
+        return dict(_generation_totals)
+
+
+def _add_prompt_cache_usage(prompt_tokens: Optional[int], cached_tokens: Optional[int]) -> None:
+    with _prompt_cache_totals_lock:
+        _prompt_cache_totals["calls"] += 1
+        if prompt_tokens is not None:
+            _prompt_cache_totals["prompt_tokens"] += prompt_tokens
+        if cached_tokens is not None:
+            _prompt_cache_totals["reported_calls"] += 1
+            _prompt_cache_totals["cached_tokens"] += cached_tokens
+
+
+def extract_prompt_cache_usage(response) -> Tuple[Optional[int], Optional[int]]:
+    """Return (prompt_tokens, cached_tokens) from a chat model response.
+
+    Either value is None when the provider does not report it.
+    """
+    usage = getattr(response, "usage_metadata", None) or {}
+    if usage:
+        details = usage.get("input_token_details") or {}
+        return usage.get("input_tokens"), details.get("cache_read")
+
+    # Older integrations only expose the raw provider usage block
+    metadata = getattr(response, "response_metadata", None) or {}
+    token_usage = metadata.get("token_usage") or metadata.get("usage") or {}
+    details = token_usage.get("prompt_tokens_details") or {}
+    return token_usage.get("prompt_tokens"), details.get("cached_tokens")
+
+# Critique batchers are shared across sessions using the same provider and
+# key. The registry is keyed by a hash of the key, and a batcher's worker
+# exits (and the batcher is dropped) after BATCHER_IDLE_SECONDS without work.
+BATCHER_IDLE_SECONDS = 60
+CRITIQUE_TIMEOUT_SECONDS = float(os.getenv("CRITIQUE_TIMEOUT_SECONDS", "120"))
+_critique_batchers: Dict[Tuple[str, str], "CritiqueBatcher"] = {}
+_critique_batchers_lock = threading.Lock()
+
+
+class CritiqueBatcher:
+    """Micro-batching scheduler that critiques several speeches per LLM call.
+
+    Requests arriving within ``max_wait`` seconds of each other (up to
+    ``max_batch_size``) are sent as one multi-speech prompt and the
+    per-speech critiques are fanned back out to the callers.
+    """
+
+    def __init__(self, llm, max_batch_size: int = 5, max_wait: float = 0.05,
+                 idle_timeout: float = BATCHER_IDLE_SECONDS):
+        self.llm = llm
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.idle_timeout = idle_timeout
+        self.closed = False
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._state_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, speech: str) -> Future:
+        """Queue a speech for critique and return a future for the result"""
+        future: Future = Future()
+        with self._state_lock:
+            if self.closed:
+                raise RuntimeError("CritiqueBatcher has shut down")
+            self._queue.put((speech, future))
+        return future
+
+    def _collect_batch(self) -> Optional[List[Tuple[str, Future]]]:
+        """Wait for the next batch, or return None once idle for idle_timeout"""
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.idle_timeout)]
+                break
+            except queue.Empty:
+                with self._state_lock:
+                    if self._queue.empty():
+                        self.closed = True
+                        return None
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect_batch()
+            if batch is None:
+                return
+            try:
+                critiques = self._critique_batch([speech for speech, _ in batch])
+                for (_, future), critique in zip(batch, critiques):
+                    future.set_result(critique)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _invoke(self, prompt_name: str, **variables) -> str:
+        response = self.llm.invoke(getattr(prompts, prompt_name).to_messages(**variables))
+        # Batched calls serve several sessions, so only the process totals are updated
+        _add_prompt_cache_usage(*extract_prompt_cache_usage(response))
+        return response.content
+
+    def _critique_batch(self, speeches: List[str]) -> List[str]:
+        if len(speeches) == 1:
+            return [self._invoke("critique_prompt", speech=speeches[0])]
+
+        numbered = "\n\n".join(
+            f"=== SPEECH {i} ===\n{speech}" for i, speech in enumerate(speeches, 1)
+        )
+        critiques = parse_batch_critiques(
+            self._invoke("batch_critique_prompt", speeches=numbered), len(speeches)
+        )
+        # Any speech the model skipped or mangled is critiqued on its own
+        return [
+            critique if critique else self._invoke("critique_prompt", speech=speech)
+            for speech, critique in zip(speeches, critiques)
+        ]
+
+
+_CRITIQUE_MARKER = re.compile(r"^\s*=+\s*CRITIQUE\s+(\d+)\s*=+\s*$", re.MULTILINE | re.IGNORECASE)
+
+
+def parse_batch_critiques(text: str, count: int) -> List[Optional[str]]:
+    """Split a batched critique response into per-speech critiques.
+
+    Returns a list of length ``count``; entries the model did not produce
+    are None.
+    """
+    critiques: List[Optional[str]] = [None] * count
+    markers = list(_CRITIQUE_MARKER.finditer(text))
+    for marker, next_marker in zip(markers, markers[1:] + [None]):
+        index = int(marker.group(1)) - 1
+        end = next_marker.start() if next_marker else len(text)
+        body = text[marker.end():end].strip()
+        if 0 <= index < count and body and critiques[index] is None:
+            critiques[index] = body
+    return critiques
+
+
+def submit_critique(provider: str, api_key: str, llm, speech: str) -> Future:
+    """Queue a speech on the shared batcher for this provider and key"""
+    key = (provider, hashlib.sha256(api_key.encode("utf-8")).hexdigest())
+    with _critique_batchers_lock:
+        # Drop batchers whose workers have exited after going idle
+        for stale_key in [k for k, b in _critique_batchers.items() if b.closed]:
+            del _critique_batchers[stale_key]
+
+        batcher = _critique_batchers.get(key)
+        if batcher is not None:
+            try:
+                return batcher.submit(speech)
+            except RuntimeError:
+                pass  # Shut down between the check above and the submit
+
+        batcher = CritiqueBatcher(
+            llm,
+            max_batch_size=int(os.getenv("CRITIQUE_BATCH_SIZE", "5")),
+            max_wait=float(os.getenv("CRITIQUE_BATCH_WAIT_MS", "50")) / 1000
+        )
+        _critique_batchers[key] = batcher
+        return batcher.submit(speech)
+
+
 class ModelManager:
     """Utility class to manage different model providers"""
     
     @staticmethod
     def get_available_providers() -> Dict[str, str]:
-        return {
+        providers = {
             "Groq (Llama3-70B)": "groq",
             "OpenAI (GPT-3.5-Turbo)": "openai"
         }
+        if ModelManager.local_model_available():
+            providers["Local CPU (llama.cpp GGUF)"] = "local"
+        return providers
     
     @staticmethod
     def get_api_key_name(provider: str) -> str:
@@ -146,10 +585,20 @@ class ModelManager:
             "openai": "OPENAI_API_KEY"
         }
         return key_mapping.get(provider, "API_KEY")
+
+    @staticmethod
+    def local_model_available() -> bool:
+        """Whether the server has a local model configured"""
+        from local_llm import get_local_model_path
+        return get_local_model_path() is not None
     
     @staticmethod
     def validate_api_key(api_key: str, provider: str) -> bool:
         """Basic validation for API key format"""
+        if provider == "local":
+            # No key: the model is chosen by server config, not the user
+            return ModelManager.local_model_available()
+
         if not api_key:
             return False
         
@@ -0,0 +1,130 @@
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# llama-cpp-python is an optional dependency and is only imported when the
+# local provider is actually selected.
+
+# The model path only ever comes from server config (LOCAL_MODEL_PATH),
+# never from user input. At most one model is loaded per process and it is
+# shared by every session.
+_loaded_model: Optional[Tuple[str, Any, threading.Lock]] = None
+_loaded_model_lock = threading.Lock()
+
+
+def get_local_model_path() -> Optional[str]:
+    """Configured GGUF model path, or None if the local provider is unavailable"""
+    model_path = os.getenv("LOCAL_MODEL_PATH")
+    if model_path and model_path.endswith(".gguf") and os.path.isfile(model_path):
+        return model_path
+    return None
+
+
+def get_local_model_config() -> Dict[str, int]:
+    """Read local model settings from the environment"""
+    return {
+        "n_threads": int(os.getenv("LOCAL_MODEL_THREADS", os.cpu_count() or 4)),
+        "n_ctx": int(os.getenv("LOCAL_MODEL_CTX", "4096")),
+        "n_batch": int(os.getenv("LOCAL_MODEL_BATCH", "512")),
+    }
+
+
+def load_local_model() -> Tuple[Any, threading.Lock]:
+    """Load the configured GGUF model once per process and return it with its lock"""
+    global _loaded_model
+
+    model_path = get_local_model_path()
+    if model_path is None:
+        raise RuntimeError("No local model configured: set LOCAL_MODEL_PATH to a .gguf file")
+
+    with _loaded_model_lock:
+        if _loaded_model is None or _loaded_model[0] != model_path:
+            # Drop any previously configured model before loading the new one
+            _loaded_model = None
+            try:
+                from llama_cpp import Llama
+            except ImportError as e:
+                raise ImportError(
+                    "The local provider needs llama-cpp-python: pip install llama-cpp-python"
+                ) from e
+
+            config = get_local_model_config()
+            model = Llama(
+                model_path=model_path,
+                n_threads=config["n_threads"],
+                n_ctx=config["n_ctx"],
+                n_batch=config["n_batch"],
+                verbose=False
+            )
+            # A llama.cpp context is not thread-safe, so calls are serialised
+            _loaded_model = (model_path, model, threading.Lock())
+        return _loaded_model[1], _loaded_model[2]
+
+
+class LocalResponse:
+    """Minimal chat response matching the fields SpeechGenerator reads"""
+
+    def __init__(self, content: str, token_usage: Dict[str, int], finish_reason: Optional[str] = None):
+        self.content = content
+        self.response_metadata = {"token_usage": token_usage, "finish_reason": finish_reason}
+
+
+class LocalChatModel:
+    """Chat model backed by a quantised GGUF model running on the CPU"""
+
+    def __init__(self, temperature: float = 0.8, max_tokens: Optional[int] = None):
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.model, self._lock = load_local_model()
+
+    @staticmethod
+    def _to_chat_messages(messages: Sequence[Tuple[str, str]]) -> List[Dict[str, str]]:
+        roles = {"system": "system", "human": "user", "ai": "assistant"}
+        return [{"role": roles.get(role, role), "content": content} for role, content in messages]
+
+    def _complete(self, messages: Sequence[Tuple[str, str]], stop: Optional[List[str]] = None,
+                  max_tokens: Optional[int] = None) -> LocalResponse:
+        result = self.model.create_chat_completion(
+            messages=self._to_chat_messages(messages),
+            temperature=self.temperature,
+            max_tokens=max_tokens or self.max_tokens,
+            stop=stop
+        )
+        return LocalResponse(
+            result["choices"][0]["message"]["content"],
+            result.get("usage", {}),
+            result["choices"][0].get("finish_reason")
+        )
+
+    def invoke(self, messages: Sequence[Tuple[str, str]], stop: Optional[List[str]] = None,
+               max_tokens: Optional[int] = None) -> LocalResponse:
+        """Generate a response for one list of (role, content) messages"""
+        with self._lock:
+            return self._complete(messages, stop, max_tokens)
+
+    def stream(self, messages: Sequence[Tuple[str, str]], stop: Optional[List[str]] = None,
+               max_tokens: Optional[int] = None) -> Iterator[LocalResponse]:
+        """Yield the response in chunks; closing the iterator stops generation"""
+        with self._lock:
+            chunks = self.model.create_chat_completion(
+                messages=self._to_chat_messages(messages),
+                temperature=self.temperature,
+                max_tokens=max_tokens or self.max_tokens,
+                stop=stop,
+                stream=True
+            )
+            for chunk in chunks:
+                choice = chunk["choices"][0]
+                content = choice["delta"].get("content")
+                if content or choice.get("finish_reason"):
+                    yield LocalResponse(content or "", {}, choice.get("finish_reason"))
+
+    def batch(self, inputs: List[Sequence[Tuple[str, str]]], stop: Optional[List[str]] = None,
+              max_tokens: Optional[int] = None) -> List[LocalResponse]:
+        """Generate responses for many prompts one after another.
+
+        The lock is taken per prompt so interactive sessions can interleave
+        with a bulk job; consecutive prompts that share the static
+        instructions still reuse llama.cpp's cached prefix evaluation.
+        """
+        return [self.invoke(messages, stop, max_tokens) for messages in inputs]
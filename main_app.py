@@ -1,6 +1,8 @@
 import streamlit as st
-from chains import SpeechGenerator, ModelManager
+from chains import SpeechGenerator, ModelManager, get_prompt_cache_stats, get_generation_stats
 from news_fetcher import NewsFetcher
+from speech_analyzer import analyze_speech
+from session_store import SessionStateManager
 import os
 from datetime import datetime
 
@@ -66,10 +68,15 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Initialize session state
-if 'speech_history' not in st.session_state:
-    st.session_state.speech_history = []
-if 'news_fetcher' not in st.session_state:
-    st.session_state.news_fetcher = NewsFetcher()
+# Speeches, critiques and history live in the shared payload store; the
+# session itself only keeps handles into it.
+session = SessionStateManager(st.session_state)
+
+@st.cache_resource
+def get_news_fetcher() -> NewsFetcher:
+    return NewsFetcher()
+
+news_fetcher = get_news_fetcher()
 
 # Sidebar
 with st.sidebar:
@@ -87,10 +94,20 @@ with st.sidebar:
     
     # API Key Input
     api_key_name = ModelManager.get_api_key_name(selected_provider)
-    api_key = st.text_input(
-        f"Enter {api_key_name}",
-        type="password",
-        help=f"Get your API key from the {selected_provider_name} dashboard"
+    if selected_provider == "local":
+        # The model is configured on the server; nothing to enter
+        api_key = ""
+        st.info("Local model available on this server")
+    else:
+        api_key = st.text_input(
+            f"Enter {api_key_name}",
+            type="password",
+            help=f"Get your API key from the {selected_provider_name} dashboard"
+        )
+    
+    instant_critique_only = st.checkbox(
+        "⚡ Instant critique only",
+        help="Score the speech locally and skip the LLM critique call"
     )
     
     # Validate API key
@@ -106,13 +123,19 @@ with st.sidebar:
     # Refresh topics button
     if st.button("🔄 Refresh Topics", use_container_width=True):
         with st.spinner("Fetching latest news..."):
-            st.session_state.topics = st.session_state.news_fetcher.get_trending_topics()
-            st.success("Topics refreshed!")
+            if news_fetcher.refresh_topics():
+                st.success("Topics refreshed!")
+            else:
+                st.error(news_fetcher.get_topic_error())
     
-    # Initialize topics if not exists
-    if 'topics' not in st.session_state:
-        with st.spinner("Loading trending topics..."):
-            st.session_state.topics = st.session_state.news_fetcher.get_trending_topics()
+    # Use cached topics (or placeholders while they load in the background)
+    st.session_state.topics = news_fetcher.get_cached_topics()
+    if not news_fetcher.has_cached_topics():
+        topic_error = news_fetcher.get_topic_error()
+        if topic_error:
+            st.warning(f"{topic_error}. Showing popular topics instead.")
+        else:
+            st.caption("Showing popular topics while trending news loads...")
     
     # Topic selector
     selected_topic = st.selectbox(
@@ -194,7 +217,12 @@ with col1:
             try:
                 with st.spinner("Generating satirical speech..."):
                     # Initialize speech generator
-                    speech_gen = SpeechGenerator(api_key, selected_provider)
+                    speech_gen = SpeechGenerator(
+                        api_key,
+                        selected_provider,
+                        batch_critiques=os.getenv("CRITIQUE_BATCHING") == "1",
+                        local_critique=instant_critique_only
+                    )
                     
                     # Generate speech and critique
                     result = speech_gen.generate_speech_and_critique(
@@ -207,11 +235,14 @@ with col1:
                     )
                     
                     # Store in session state
-                    st.session_state.current_speech = result["speech"]
-                    st.session_state.current_critique = result["critique"]
+                    session.set("current_speech", result["speech"])
+                    session.set("current_critique", result["critique"])
+                    st.session_state.current_blame = blame
+                    st.session_state.current_critique_local = instant_critique_only
+                    st.session_state.last_prompt_stats = speech_gen.last_prompt_stats
                     
                     # Add to history
-                    st.session_state.speech_history.append({
+                    session.append_history({
                         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                         "topic": final_topic,
                         "speech": result["speech"],
@@ -231,16 +262,27 @@ with col1:
                 st.error(f"Error: {e}")
     
     # Display current speech
-    if 'current_speech' in st.session_state:
+    current_speech = session.get("current_speech")
+    current_critique = session.get("current_critique")
+    if current_speech is not None:
         st.markdown(f"""
         <div class="speech-container">
             <h3>🎙️ Generated Speech</h3>
-            <p style="font-size: 1.1em; line-height: 1.6;">{st.session_state.current_speech}</p>
+            <p style="font-size: 1.1em; line-height: 1.6;">{current_speech}</p>
         </div>
         """, unsafe_allow_html=True)
         
+        # Instant local scores
+        analysis = analyze_speech(
+            current_speech,
+            st.session_state.get('current_blame')
+        )
+        score_cols = st.columns(len(analysis["scores"]))
+        for score_col, (name, score) in zip(score_cols, analysis["scores"].items()):
+            score_col.metric(name, f"{score}/10")
+        
         # Download button
-        speech_text = f"Topic: {final_topic}\n\nSpeech:\n{st.session_state.current_speech}"
+        speech_text = f"Topic: {final_topic}\n\nSpeech:\n{current_speech}"
         st.download_button(
             label="📥 Download Speech",
             data=speech_text,
@@ -249,11 +291,14 @@ with col1:
         )
     
     # Display critique
-    if 'current_critique' in st.session_state:
+    if current_critique is not None and st.session_state.get('current_critique_local'):
+        # The local Jumla-Meter is markdown, so it gets its own markdown call
+        st.markdown(current_critique)
+    elif current_critique is not None:
         st.markdown(f"""
         <div class="critique-container">
             <h3>🔍 AI Critique</h3>
-            <p style="font-size: 1.05em; line-height: 1.6;">{st.session_state.current_critique}</p>
+            <p style="font-size: 1.05em; line-height: 1.6;">{current_critique}</p>
         </div>
         """, unsafe_allow_html=True)
 
@@ -277,8 +322,9 @@ with col2:
     # Speech History
     st.subheader("📜 Speech History")
     
-    if st.session_state.speech_history:
-        for i, entry in enumerate(reversed(st.session_state.speech_history[-5:])):  # Show last 5
+    recent_history = session.recent_history(5)  # Show last 5
+    if recent_history:
+        for i, entry in enumerate(recent_history):
             with st.expander(f"🕐 {entry['timestamp']} - {entry['topic'][:30]}..."):
                 st.write(f"**Topic:** {entry['topic']}")
                 st.write(f"**Speech:** {entry['speech'][:200]}...")
@@ -288,7 +334,7 @@ with col2:
     
     # Clear history button
     if st.button("🗑️ Clear History", use_container_width=True):
-        st.session_state.speech_history = []
+        session.clear_history()
         st.success("History cleared!")
 
 # Footer
@@ -302,7 +348,7 @@ st.markdown("""
 # Instructions
 with st.expander("ℹ️ How to Use"):
     st.markdown("""
-    1. **Setup**: Enter your API key for either Groq or OpenAI in the sidebar
+    1. **Setup**: Enter your API key for Groq or OpenAI in the sidebar, or pick the local model if the server has one
     2. **Choose Topic**: Select from trending topics or enter a custom topic
     3. **Adjust Parameters**: Use the sliders to control speech characteristics
     4. **Generate**: Click the generate button to create your satirical speech
@@ -321,4 +367,9 @@ with st.expander("ℹ️ How to Use"):
 if st.checkbox("🔧 Debug Info"):
     st.write("Session State Keys:", list(st.session_state.keys()))
     st.write("API Key Valid:", api_key_valid)
-    st.write("Selected Provider:", selected_provider)
\ No newline at end of file
+    st.write("Selected Provider:", selected_provider)
+    if 'last_prompt_stats' in st.session_state:
+        st.write("Prompt Cache Stats (per prompt):", st.session_state.last_prompt_stats)
+    st.write("Prompt Cache Totals (process):", get_prompt_cache_stats())
+    st.write("Generation Stats (process):", get_generation_stats())
+    st.write("Session Memory:", session.memory_report())
\ No newline at end of file
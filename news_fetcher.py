@@ -1,9 +1,26 @@
-import requests
-import feedparser
-from bs4 import BeautifulSoup
-import yake
-from typing import List, Dict
-import streamlit as st
+import threading
+import time
+from typing import List, Dict, Optional, Tuple
+
+# feedparser and yake are imported inside the methods that use them so that
+# the first page render does not pay for them. Errors are returned rather
+# than shown here, since fetches also run on a background thread with no
+# Streamlit script context; main_app decides how to display them.
+
+# Trending topics are shared by every session in the process and refreshed
+# in the background; sessions render placeholder topics until it is warm.
+# Only successful fetches are cached; failed ones are retried after
+# TOPIC_RETRY_SECONDS and the error is kept for the page to display.
+TOPIC_CACHE_TTL = 15 * 60
+TOPIC_RETRY_SECONDS = 60
+_topic_cache: Dict[str, object] = {
+    "topics": None,
+    "fetched_at": 0.0,
+    "attempted_at": None,
+    "error": None,
+}
+_topic_cache_lock = threading.Lock()
+_topic_refresh_thread: Optional[threading.Thread] = None
 
 class NewsFetcher:
     def __init__(self):
@@ -11,8 +28,17 @@ class NewsFetcher:
         
     def fetch_google_news(self, max_articles: int = 20) -> List[Dict]:
         """Fetch news from Google News RSS feed"""
+        return self._fetch_articles(max_articles)[0]
+
+    def _fetch_articles(self, max_articles: int) -> Tuple[List[Dict], Optional[str]]:
+        """Fetch articles, returning (articles, error message or None)"""
         try:
+            import feedparser
+
             feed = feedparser.parse(self.google_news_rss)
+            error = None
+            if not feed.entries and getattr(feed, "bozo_exception", None):
+                error = f"Error fetching Google News: {feed.bozo_exception}"
             articles = []
             
             for entry in feed.entries[:max_articles]:
@@ -23,37 +49,47 @@ class NewsFetcher:
                     'summary': entry.summary if hasattr(entry, 'summary') else entry.title
                 })
             
-            return articles
+            return articles, error
         except Exception as e:
-            st.error(f"Error fetching Google News: {e}")
-            return []
+            return [], f"Error fetching Google News: {e}"
     
     def extract_keywords(self, text: str, max_keywords: int = 10) -> List[str]:
         """Extract keywords using YAKE"""
         try:
-            kw_extractor = yake.KeywordExtractor(
-                lan="en",
-                n=3,
-                dedupLim=0.7,
-                top=max_keywords
-            )
-            keywords = kw_extractor.extract_keywords(text)
-            return [kw[1] for kw in keywords]
-        except Exception as e:
-            st.error(f"Error extracting keywords: {e}")
+            return self._extract_keywords(text, max_keywords)
+        except Exception:
             return []
+
+    def _extract_keywords(self, text: str, max_keywords: int) -> List[str]:
+        import yake
+
+        kw_extractor = yake.KeywordExtractor(
+            lan="en",
+            n=3,
+            dedupLim=0.7,
+            top=max_keywords
+        )
+        keywords = kw_extractor.extract_keywords(text)
+        return [kw[1] for kw in keywords]
     
     def get_trending_topics(self) -> List[str]:
         """Get trending topics from news articles"""
-        articles = self.fetch_google_news()
+        return self._fetch_trending_topics()[0] or self.get_fallback_topics()
+
+    def _fetch_trending_topics(self) -> Tuple[Optional[List[str]], Optional[str]]:
+        """Return (topics, error); topics is None if nothing could be fetched"""
+        articles, error = self._fetch_articles(20)
         if not articles:
-            return self.get_fallback_topics()
+            return None, error or "No trending news could be fetched"
         
         # Combine all headlines
         all_headlines = " ".join([article['title'] for article in articles])
         
         # Extract keywords
-        keywords = self.extract_keywords(all_headlines, max_keywords=15)
+        try:
+            keywords = self._extract_keywords(all_headlines, max_keywords=15)
+        except Exception as e:
+            return None, f"Error extracting keywords: {e}"
         
         # Create topic clusters manually (simplified approach)
         topics = []
@@ -81,7 +117,57 @@ class NewsFetcher:
             if len(keyword.split()) <= 2 and keyword.lower() not in [t.lower() for t in topics]:
                 topics.append(keyword.title())
         
-        return topics[:8] if topics else self.get_fallback_topics()
+        if not topics:
+            return None, "No trending topics found in the news"
+        return topics[:8], None
+
+    def refresh_topics(self) -> bool:
+        """Fetch trending topics now and cache them if the fetch succeeded"""
+        topics, error = self._fetch_trending_topics()
+        with _topic_cache_lock:
+            _topic_cache["attempted_at"] = time.monotonic()
+            if topics:
+                _topic_cache["topics"] = topics
+                _topic_cache["fetched_at"] = _topic_cache["attempted_at"]
+                _topic_cache["error"] = None
+            else:
+                _topic_cache["error"] = error
+        return bool(topics)
+
+    def get_topic_error(self) -> Optional[str]:
+        """Error from the most recent failed topic fetch, if any"""
+        with _topic_cache_lock:
+            return _topic_cache["error"]
+
+    def has_cached_topics(self) -> bool:
+        """Whether the shared topic cache has been populated"""
+        with _topic_cache_lock:
+            return _topic_cache["topics"] is not None
+
+    def get_cached_topics(self) -> List[str]:
+        """Return cached trending topics without blocking on the network.
+
+        If the cache is empty or older than TOPIC_CACHE_TTL, a background
+        refresh is started (at most once per TOPIC_RETRY_SECONDS) and the
+        cached (or fallback) topics are returned straight away.
+        """
+        global _topic_refresh_thread
+
+        with _topic_cache_lock:
+            now = time.monotonic()
+            topics = _topic_cache["topics"]
+            stale = now - _topic_cache["fetched_at"] > TOPIC_CACHE_TTL
+            attempted_at = _topic_cache["attempted_at"]
+            retry_due = attempted_at is None or now - attempted_at > TOPIC_RETRY_SECONDS
+            if (topics is None or stale) and retry_due and not (
+                _topic_refresh_thread and _topic_refresh_thread.is_alive()
+            ):
+                _topic_refresh_thread = threading.Thread(
+                    target=self.refresh_topics, daemon=True
+                )
+                _topic_refresh_thread.start()
+
+        return list(topics) if topics else self.get_fallback_topics()
     
     def get_fallback_topics(self) -> List[str]:
         """Fallback topics if news fetching fails"""
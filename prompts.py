@@ -1,32 +1,50 @@
-from langchain.prompts import PromptTemplate
+from string import Formatter
+from typing import List, Tuple
+
+# Each prompt is split into a static instruction block and a short request
+# carrying the variables. The static block always comes first so that every
+# call shares the same prefix and providers can serve it from their prompt
+# cache; only the request at the end changes between calls.
+
+# Requested speech length, also used to budget output tokens
+SPEECH_MIN_WORDS = 200
+SPEECH_MAX_WORDS = 300
 
 # Speech Generation Template
-SPEECH_TEMPLATE = """
-Write a satirical Indian political rally speech in Hinglish about the topic: "{topic}".
+SPEECH_INSTRUCTIONS = f"""
+Write a satirical Indian political rally speech in Hinglish.
 
-Parameters:
-- Tone: {tone}/10 (1=Secular, 10=Nationalistic)
-- Blame Target: {blame}
-- Freebies Level: {freebies}/10 (1=None, 10=Maximum)
-- Hindutva Intensity: {hindutva}/10 (1=Minimal, 10=Maximum)
-- Development Promises: {development}/10 (1=Vague, 10=Specific)
+Parameter scales:
+- Tone: 1=Secular, 10=Nationalistic
+- Freebies Level: 1=None, 10=Maximum
+- Hindutva Intensity: 1=Minimal, 10=Maximum
+- Development Promises: 1=Vague, 10=Specific
 
 Guidelines:
 - Use classic political phrases like "Mitron", "Sabka Saath Sabka Vikas", "Desh ki janta maaf nahi karegi"
 - Mix Hindi and English naturally (Hinglish)
 - Include typical rally elements: crowd interactions, dramatic pauses, rhetorical questions
 - Make it humorous and ironic while maintaining the satirical tone
-- Length: 200-300 words
+- Length: {SPEECH_MIN_WORDS}-{SPEECH_MAX_WORDS} words
 - Include some popular political catchphrases and slogans
+"""
+
+SPEECH_REQUEST = """
+Topic: "{topic}"
+
+Parameters:
+- Tone: {tone}/10
+- Blame Target: {blame}
+- Freebies Level: {freebies}/10
+- Hindutva Intensity: {hindutva}/10
+- Development Promises: {development}/10
 
 Speech:
 """
 
 # Critique Template
-CRITIQUE_TEMPLATE = """
-Analyze the following satirical political speech and provide a humorous critique:
-
-Speech: {speech}
+CRITIQUE_INSTRUCTIONS = """
+Analyze the satirical political speech given below and provide a humorous critique.
 
 Provide analysis on:
 1. Jumla Density (how many empty promises per paragraph)
@@ -38,16 +56,31 @@ Provide analysis on:
 
 Format as a witty, sarcastic review with ratings out of 10 for each category.
 Keep the tone light and humorous while being insightful.
+"""
+
+CRITIQUE_REQUEST = """
+Speech: {speech}
 
 Critique:
 """
 
-# Topic Summarization Template
-TOPIC_SUMMARIZER_TEMPLATE = """
-Summarize the following news headlines into 5 distinct trending topics suitable for political speeches:
+# Batched Critique Template (several speeches answered in one call)
+BATCH_CRITIQUE_INSTRUCTIONS = CRITIQUE_INSTRUCTIONS + """
+You will be given several speeches, each introduced by a line of the form
+"=== SPEECH n ===". Critique every speech independently and start each
+critique with a line of the form "=== CRITIQUE n ===" using the same number.
+Do not write anything before the first critique marker.
+"""
 
-Headlines:
-{headlines}
+BATCH_CRITIQUE_REQUEST = """
+{speeches}
+
+Critiques:
+"""
+
+# Topic Summarization Template
+TOPIC_SUMMARIZER_INSTRUCTIONS = """
+Summarize the news headlines given below into 5 distinct trending topics suitable for political speeches.
 
 Extract the main themes and present them as:
 1. Topic Name
@@ -59,18 +92,68 @@ Extract the main themes and present them as:
 Keep topics broad enough for political commentary but specific enough to be meaningful.
 """
 
+TOPIC_SUMMARIZER_REQUEST = """
+Headlines:
+{headlines}
+"""
+
+# Full single-string templates, static content first
+SPEECH_TEMPLATE = SPEECH_INSTRUCTIONS + SPEECH_REQUEST
+CRITIQUE_TEMPLATE = CRITIQUE_INSTRUCTIONS + CRITIQUE_REQUEST
+BATCH_CRITIQUE_TEMPLATE = BATCH_CRITIQUE_INSTRUCTIONS + BATCH_CRITIQUE_REQUEST
+TOPIC_SUMMARIZER_TEMPLATE = TOPIC_SUMMARIZER_INSTRUCTIONS + TOPIC_SUMMARIZER_REQUEST
+
+
+class CompiledPrompt:
+    """A prompt compiled once into a static prefix and a variable request"""
+
+    def __init__(self, instructions: str, request: str, input_variables: List[str]):
+        fields = {field for _, field, _, _ in Formatter().parse(request) if field}
+        if fields != set(input_variables):
+            raise ValueError(
+                f"Template variables {sorted(fields)} do not match {sorted(input_variables)}"
+            )
+        if any(field for _, field, _, _ in Formatter().parse(instructions)):
+            raise ValueError("Static instructions must not contain template variables")
+
+        self.input_variables = input_variables
+        self.static_prefix = instructions.strip()
+        self._request = request.strip()
+
+    def format_request(self, **kwargs) -> str:
+        """Fill in the variable part of the prompt"""
+        return self._request.format(**kwargs)
+
+    def format(self, **kwargs) -> str:
+        """Render the whole prompt as a single string"""
+        return f"{self.static_prefix}\n\n{self.format_request(**kwargs)}"
+
+    def to_messages(self, **kwargs) -> List[Tuple[str, str]]:
+        """Render as (role, content) chat messages with the static prefix first"""
+        return [("system", self.static_prefix), ("human", self.format_request(**kwargs))]
+
+
 # Create prompt templates
-speech_prompt = PromptTemplate(
-    input_variables=["topic", "tone", "blame", "freebies", "hindutva", "development"],
-    template=SPEECH_TEMPLATE
+speech_prompt = CompiledPrompt(
+    SPEECH_INSTRUCTIONS,
+    SPEECH_REQUEST,
+    input_variables=["topic", "tone", "blame", "freebies", "hindutva", "development"]
+)
+
+critique_prompt = CompiledPrompt(
+    CRITIQUE_INSTRUCTIONS,
+    CRITIQUE_REQUEST,
+    input_variables=["speech"]
 )
 
-critique_prompt = PromptTemplate(
-    input_variables=["speech"],
-    template=CRITIQUE_TEMPLATE
+batch_critique_prompt = CompiledPrompt(
+    BATCH_CRITIQUE_INSTRUCTIONS,
+    BATCH_CRITIQUE_REQUEST,
+    input_variables=["speeches"]
 )
 
-topic_summarizer_prompt = PromptTemplate(
-    input_variables=["headlines"],
-    template=TOPIC_SUMMARIZER_TEMPLATE
-)
\ No newline at end of file
+topic_summarizer_prompt = CompiledPrompt(
+    TOPIC_SUMMARIZER_INSTRUCTIONS,
+    TOPIC_SUMMARIZER_REQUEST,
+    input_variables=["headlines"]
+)
@@ -5,15 +5,253 @@ Run this to test the core functionality without Streamlit UI
 """
 
 import os
+import subprocess
 import sys
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Cold-start budget for importing the app modules on top of Streamlit
+IMPORT_BUDGET_MS = float(os.getenv('IMPORT_BUDGET_MS', '150'))
+
+# Modules that must not be loaded just by importing the app modules
+LAZY_MODULES = ["langchain", "langchain_groq", "langchain_openai", "feedparser", "yake", "bs4"]
+
+def test_import_budget():
+    """Check that importing the app modules stays within the cold-start budget"""
+    print("⏱️  Testing Import Budget...")
+    probe = (
+        "import sys, time\n"
+        "import streamlit\n"
+        "start = time.perf_counter()\n"
+        "import chains, news_fetcher\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        f"loaded = [m for m in {LAZY_MODULES!r} if m in sys.modules]\n"
+        "print(elapsed)\n"
+        "print(','.join(loaded))\n"
+    )
+    try:
+        output = subprocess.run(
+            [sys.executable, "-c", probe],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+        elapsed_ms = float(output[0])
+        loaded = [m for m in output[1].split(",") if m] if len(output) > 1 else []
+
+        print(f"   Import time: {elapsed_ms:.1f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)")
+        if loaded:
+            print(f"❌ Heavy modules imported eagerly: {', '.join(loaded)}")
+            return False
+        if elapsed_ms > IMPORT_BUDGET_MS:
+            print("❌ Import budget exceeded")
+            return False
+
+        print("✅ Import budget met")
+        return True
+    except Exception as e:
+        print(f"❌ Import budget error: {e}")
+        return False
+
+# Per-call budget for rendering the speech prompt
+PROMPT_FORMAT_BUDGET_US = float(os.getenv('PROMPT_FORMAT_BUDGET_US', '20'))
+
+def test_prompt_formatting():
+    """Check prompt formatting cost and that static content comes first"""
+    print("\n🧩 Testing Prompt Formatting...")
+    try:
+        import timeit
+        from prompts import speech_prompt
+
+        variables = {
+            "topic": "Economic Growth",
+            "tone": 7,
+            "blame": "Opposition",
+            "freebies": 5,
+            "hindutva": 4,
+            "development": 8
+        }
+        messages = speech_prompt.to_messages(**variables)
+        if "Economic Growth" in messages[0][1]:
+            print("❌ Variable content leaked into the static prefix")
+            return False
+
+        runs = 10000
+        total = timeit.timeit(lambda: speech_prompt.to_messages(**variables), number=runs)
+        per_call_us = total / runs * 1e6
+
+        print(f"   Format time: {per_call_us:.2f} µs/call (budget {PROMPT_FORMAT_BUDGET_US:.0f} µs)")
+        if per_call_us > PROMPT_FORMAT_BUDGET_US:
+            print("❌ Prompt formatting budget exceeded")
+            return False
+
+        print("✅ Prompt formatting budget met")
+        return True
+    except Exception as e:
+        print(f"❌ Prompt formatting error: {e}")
+        return False
+
+# Per-call budget for the local speech analyser
+ANALYZER_BUDGET_US = float(os.getenv('ANALYZER_BUDGET_US', '1000'))
+
+SAMPLE_SPEECH = """Mitron! Bhaiyon aur behno! Hum har ghar mein free bijli denge. Opposition ne 70 saal kuch nahi kiya, aur media sab chhupata hai.
+
+We will build 100 smart cities. Achhe din aayenge! Hum 2 crore naukri denge, yeh mera vaada hai. Sabka saath sabka vikas!
+
+Pichli sarkar ne desh ko loota. Corrupt babus ko hum hatayenge. Jai Hind! Bharat Mata Ki Jai!"""
+
+def test_speech_analyzer():
+    """Check the local speech analyser's scores and speed"""
+    print("\n⚡ Testing Speech Analyzer...")
+    try:
+        import timeit
+        from speech_analyzer import analyze_speech
+
+        analysis = analyze_speech(SAMPLE_SPEECH, "Opposition")
+        for name, score in analysis["scores"].items():
+            print(f"   {name}: {score}/10")
+        if not analysis["promises"] or not analysis["blame_mentions"]["Opposition"]:
+            print("❌ Analyzer missed obvious promises or blame")
+            return False
+
+        inflected = analyze_speech(
+            "We made many promises and guarantees. Our vaade are real. Corruption everywhere. "
+            "The previous governments failed. Corrupt babus ko hum hatayenge."
+        )
+        if (inflected["promises"] < 4 or not inflected["blame_mentions"]["Previous Government"]
+                or not inflected["blame_mentions"]["Corrupt Officials"]):
+            print("❌ Analyzer missed inflected promises or blame")
+            return False
+
+        english = analyze_speech(
+            "I will go to the market. The people want to see the change. "
+            "Please press the button to log in. The system is down. "
+            "Log in to the media server. Free time after the challenge."
+        )
+        print(f"   English sample Hinglish ratio: {english['hinglish_ratio']}")
+        if (english["hinglish_ratio"] > 0.05 or english["promises"]
+                or english["blame_mentions"]["Media"] or english["blame_mentions"]["System"]):
+            print("❌ Analyzer treats plain English as Hinglish, promises or blame")
+            return False
+
+        runs = 2000
+        per_call_us = timeit.timeit(lambda: analyze_speech(SAMPLE_SPEECH), number=runs) / runs * 1e6
+
+        print(f"   Analysis time: {per_call_us:.1f} µs/call (budget {ANALYZER_BUDGET_US:.0f} µs)")
+        if per_call_us > ANALYZER_BUDGET_US:
+            print("❌ Analyzer budget exceeded")
+            return False
+
+        print("✅ Speech analyzer budget met")
+        return True
+    except Exception as e:
+        print(f"❌ Speech analyzer error: {e}")
+        return False
+
+def test_length_guard():
+    """Check that the speech length guard only trims when it should"""
+    print("\n✂️  Testing Length Guard...")
+    try:
+        from chains import cut_at_sentence
+
+        # Ended on its own without final punctuation: keep everything
+        natural = "Mitron! " + " ".join(["vikas"] * 305)
+        text, cut = cut_at_sentence(natural, 300)
+        if cut or text != natural:
+            print("❌ Guard discarded a speech that ended on its own")
+            return False
+
+        # Over budget with a boundary after it: cut at that boundary
+        long_speech = " ".join(["vikas"] * 305) + ". Aur bhi vikas hoga."
+        text, cut = cut_at_sentence(long_speech, 300)
+        if not cut or not text.endswith("vikas."):
+            print("❌ Guard did not cut at the first boundary past the budget")
+            return False
+
+        # Abbreviations past the budget are not sentence ends
+        rupees = " ".join(["vikas"] * 305) + " Rs. 5 crore denge. Aur bhi vikas hoga."
+        text, cut = cut_at_sentence(rupees, 300)
+        if not cut or not text.endswith("Rs. 5 crore denge."):
+            print("❌ Guard cut at an abbreviation")
+            return False
+
+        # Token cap hit mid-sentence: trim the unfinished sentence only if
+        # enough words remain
+        capped = " ".join(["vikas"] * 250) + ". Aur bhi"
+        text, cut = cut_at_sentence(capped, 300, hit_token_cap=True)
+        if not cut or not text.endswith("vikas."):
+            print("❌ Guard did not trim an unfinished sentence at the token cap")
+            return False
+        short = "Mitron! " + " ".join(["vikas"] * 50)
+        if cut_at_sentence(short, 300, hit_token_cap=True) != (short, False):
+            print("❌ Guard trimmed below the minimum speech length")
+            return False
+
+        print("✅ Length guard behaves correctly")
+        return True
+    except Exception as e:
+        print(f"❌ Length guard error: {e}")
+        return False
+
+class StubBatchLLM:
+    """Offline chat model that records calls, for the bulk generation check"""
+
+    def __init__(self):
+        self.invoke_calls = 0
+        self.batch_calls = 0
+
+    def invoke(self, messages, **kwargs):
+        from local_llm import LocalResponse
+        self.invoke_calls += 1
+        count = messages[1][1].count("=== SPEECH ")
+        if not count:
+            return LocalResponse("Ekdum jumla, 8/10.", {})
+        return LocalResponse(
+            "\n".join(f"=== CRITIQUE {i} ===\nJumla number {i}, 8/10." for i in range(1, count + 1)), {}
+        )
+
+    def batch(self, inputs, **kwargs):
+        from local_llm import LocalResponse
+        self.batch_calls += 1
+        # First speech ran into the token cap mid-sentence, the rest ended normally
+        capped = LocalResponse(" ".join(["vikas"] * 250) + ". Aur bhi", {}, "length")
+        return [capped] + [LocalResponse("Mitron! Vikas hoga.", {}, "stop") for _ in inputs[1:]]
+
+def test_bulk_generation():
+    """Check bulk speech generation and batched critiques against a stub model"""
+    print("\n📦 Testing Bulk Generation...")
+    try:
+        from chains import SpeechGenerator
+
+        generator = SpeechGenerator("quick-start-stub", "stub")
+        generator.llm = stub = StubBatchLLM()
+
+        request = {"topic": "Economic Growth", "tone": 7, "blame": "Opposition",
+                   "freebies": 5, "hindutva": 4, "development": 8}
+        speeches = generator.generate_speech_batch([request] * 3)
+        if stub.batch_calls != 1 or len(speeches) != 3:
+            print("❌ Bulk generation did not send one batch call")
+            return False
+        if not speeches[0].endswith("vikas.") or speeches[1] != "Mitron! Vikas hoga.":
+            print("❌ Bulk generation did not trim the capped speech only")
+            return False
+
+        critiques = generator.critique_speeches(speeches)
+        print(f"   {len(critiques)} critiques from {stub.invoke_calls} LLM call(s)")
+        if [c for c in critiques if not c.startswith("Jumla number")] or stub.invoke_calls >= len(speeches):
+            print("❌ Batched critiques were not fanned out from a shared call")
+            return False
+
+        print("✅ Bulk generation and critique batching work")
+        return True
+    except Exception as e:
+        print(f"❌ Bulk generation error: {e}")
+        return False
+
 def test_news_fetcher():
     """Test news fetching functionality"""
-    print("🔍 Testing News Fetcher...")
+    print("\n🔍 Testing News Fetcher...")
     try:
         from news_fetcher import NewsFetcher
         
@@ -36,9 +274,10 @@ def test_speech_generation():
     # Check for API keys
     groq_key = os.getenv('GROQ_API_KEY')
     openai_key = os.getenv('OPENAI_API_KEY')
+    local_model = os.getenv('LOCAL_MODEL_PATH')
     
-    if not groq_key and not openai_key:
-        print("❌ No API keys found. Please set GROQ_API_KEY or OPENAI_API_KEY in .env file")
+    if not groq_key and not openai_key and not local_model:
+        print("❌ No API keys found. Please set GROQ_API_KEY, OPENAI_API_KEY or LOCAL_MODEL_PATH in .env file")
         return False
     
     try:
@@ -48,9 +287,12 @@ def test_speech_generation():
         if groq_key:
             generator = SpeechGenerator(groq_key, "groq")
             print("   Using Groq (Llama3-70B)")
-        else:
+        elif openai_key:
             generator = SpeechGenerator(openai_key, "openai")
             print("   Using OpenAI (GPT-3.5-Turbo)")
+        else:
+            generator = SpeechGenerator("", "local")
+            print("   Using local CPU model (llama.cpp)")
         
         # Generate sample speech
         print("   Generating sample speech...")
@@ -127,6 +369,11 @@ def main():
     print("=" * 60)
     
     tests = [
+        test_import_budget,
+        test_prompt_formatting,
+        test_speech_analyzer,
+        test_length_guard,
+        test_bulk_generation,
         test_news_fetcher,
         test_speech_generation,
         test_full_pipeline
@@ -0,0 +1,228 @@
+import atexit
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+# Large per-session payloads (speeches, critiques, history entries) live in a
+# process-wide, size-bounded LRU store on local disk. st.session_state only
+# keeps short handles into it, so server memory tracks active sessions.
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_IDLE_SECONDS = 30 * 60
+EVICTION_INTERVAL_SECONDS = 60
+MAX_HISTORY_HANDLES = 50
+
+# Payload files are named after their uuid4 hex handle
+_PAYLOAD_FILE_RE = re.compile(r"^[0-9a-f]{32}\.json$")
+
+
+class PayloadStore:
+    """Size-bounded LRU of JSON payloads stored as files on local disk.
+
+    The index lives in memory, so payloads left by a previous process are
+    unreachable; they are deleted on startup. Only files named like the
+    store's own payloads are touched, but two live processes must still not
+    share a directory.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._clear_directory()
+        # handle -> (session_id, size in bytes), least recently used first
+        self._index: "OrderedDict[str, tuple]" = OrderedDict()
+        self._last_seen: Dict[str, float] = {}
+        self._total_bytes = 0
+        self._last_eviction = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _clear_directory(self) -> None:
+        for name in os.listdir(self.directory):
+            if _PAYLOAD_FILE_RE.match(name):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
+
+    def _path(self, handle: str) -> str:
+        return os.path.join(self.directory, f"{handle}.json")
+
+    def _remove(self, handle: str) -> None:
+        _, size = self._index.pop(handle)
+        self._total_bytes -= size
+        try:
+            os.remove(self._path(handle))
+        except FileNotFoundError:
+            pass
+
+    def put(self, session_id: str, payload: Any) -> str:
+        """Store a payload for a session and return its handle"""
+        data = json.dumps(payload).encode("utf-8")
+        handle = uuid.uuid4().hex
+        with open(self._path(handle), "wb") as f:
+            f.write(data)
+
+        with self._lock:
+            self._index[handle] = (session_id, len(data))
+            self._total_bytes += len(data)
+            self._last_seen[session_id] = time.monotonic()
+            while self._total_bytes > self.max_bytes and len(self._index) > 1:
+                self._remove(next(iter(self._index)))
+        return handle
+
+    def get(self, handle: Optional[str]) -> Any:
+        """Load a payload, or None if it was never stored or has been evicted"""
+        with self._lock:
+            if handle not in self._index:
+                return None
+            self._index.move_to_end(handle)
+            self._last_seen[self._index[handle][0]] = time.monotonic()
+        try:
+            with open(self._path(handle), "rb") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return None
+
+    def discard(self, handles: List[str]) -> None:
+        """Drop payloads that are no longer referenced"""
+        with self._lock:
+            for handle in handles:
+                if handle in self._index:
+                    self._remove(handle)
+
+    def touch(self, session_id: str) -> None:
+        """Mark a session as active"""
+        with self._lock:
+            self._last_seen[session_id] = time.monotonic()
+
+    def evict_idle(self, max_idle_seconds: float = DEFAULT_IDLE_SECONDS) -> int:
+        """Drop all payloads of sessions idle for longer than max_idle_seconds"""
+        now = time.monotonic()
+        cutoff = now - max_idle_seconds
+        with self._lock:
+            self._last_eviction = now
+            idle = {sid for sid, seen in self._last_seen.items() if seen < cutoff}
+            handles = [h for h, (sid, _) in self._index.items() if sid in idle]
+            for handle in handles:
+                self._remove(handle)
+            for sid in idle:
+                del self._last_seen[sid]
+        return len(handles)
+
+    def maybe_evict_idle(self, max_idle_seconds: float = DEFAULT_IDLE_SECONDS) -> int:
+        """Run evict_idle at most once every EVICTION_INTERVAL_SECONDS"""
+        if time.monotonic() - self._last_eviction < EVICTION_INTERVAL_SECONDS:
+            return 0
+        return self.evict_idle(max_idle_seconds)
+
+    def session_usage(self, session_id: str) -> Dict[str, int]:
+        """Number of payloads and bytes held for one session"""
+        with self._lock:
+            sizes = [size for sid, size in self._index.values() if sid == session_id]
+        return {"payloads": len(sizes), "bytes": sum(sizes)}
+
+    def stats(self) -> Dict[str, int]:
+        """Store-wide usage"""
+        with self._lock:
+            return {
+                "payloads": len(self._index),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "sessions": len(self._last_seen),
+            }
+
+
+_store: Optional[PayloadStore] = None
+_store_lock = threading.Lock()
+
+
+def get_payload_store() -> PayloadStore:
+    """Return the process-wide payload store, configured from the environment.
+
+    By default each process gets its own directory under the system temp
+    dir, removed again on exit.
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            max_bytes = int(os.getenv("SESSION_STORE_MAX_BYTES", DEFAULT_MAX_BYTES))
+            directory = os.getenv("SESSION_STORE_DIR")
+            if directory:
+                _store = PayloadStore(directory, max_bytes)
+                atexit.register(_store._clear_directory)
+            else:
+                directory = os.path.join(tempfile.gettempdir(), "jumla_sessions", str(os.getpid()))
+                _store = PayloadStore(directory, max_bytes)
+                atexit.register(shutil.rmtree, directory, ignore_errors=True)
+        return _store
+
+
+class SessionStateManager:
+    """Keeps large values for one session in the shared store, by handle"""
+
+    def __init__(self, session_state, store: Optional[PayloadStore] = None,
+                 idle_seconds: float = DEFAULT_IDLE_SECONDS):
+        self.state = session_state
+        self.store = store or get_payload_store()
+        if "session_id" not in self.state:
+            self.state["session_id"] = uuid.uuid4().hex
+        if "payload_handles" not in self.state:
+            self.state["payload_handles"] = {}
+        if "history_handles" not in self.state:
+            self.state["history_handles"] = []
+        self.session_id = self.state["session_id"]
+        self.store.touch(self.session_id)
+        self.store.maybe_evict_idle(idle_seconds)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a large value under key, replacing any previous one"""
+        previous = self.state["payload_handles"].get(key)
+        self.state["payload_handles"][key] = self.store.put(self.session_id, value)
+        if previous:
+            self.store.discard([previous])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Load a value stored with set(), or default if missing or evicted"""
+        value = self.store.get(self.state["payload_handles"].get(key))
+        return default if value is None else value
+
+    def has(self, key: str) -> bool:
+        return key in self.state["payload_handles"]
+
+    def append_history(self, entry: Dict[str, Any]) -> None:
+        """Add a history entry, keeping at most MAX_HISTORY_HANDLES"""
+        handles = self.state["history_handles"]
+        handles.append(self.store.put(self.session_id, entry))
+        if len(handles) > MAX_HISTORY_HANDLES:
+            self.store.discard(handles[:-MAX_HISTORY_HANDLES])
+            del handles[:-MAX_HISTORY_HANDLES]
+
+    def recent_history(self, count: int) -> List[Dict[str, Any]]:
+        """Most recent history entries first, skipping evicted ones"""
+        entries = []
+        for handle in reversed(self.state["history_handles"]):
+            if len(entries) == count:
+                break
+            entry = self.store.get(handle)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    def clear_history(self) -> None:
+        self.store.discard(self.state["history_handles"])
+        self.state["history_handles"] = []
+
+    def memory_report(self) -> Dict[str, Any]:
+        """Usage for this session alongside the whole store"""
+        return {
+            "session": self.store.session_usage(self.session_id),
+            "store": self.store.stats(),
+        }
@@ -0,0 +1,149 @@
+import re
+from typing import Any, Dict, Optional
+
+# Deterministic scoring of the measurable parts of the critique. All
+# lexicons are compiled once at import so a speech is scored in microseconds.
+
+CATCHPHRASES = [
+    "mitron",
+    "sabka saath sabka vikas",
+    "desh ki janta maaf nahi karegi",
+    "achhe din",
+    "acche din",
+    "bhaiyon aur behno",
+    "bharat mata ki jai",
+    "vande mataram",
+    "jai hind",
+    "naya bharat",
+    "new india",
+    "atmanirbhar",
+    "vishwaguru",
+    "chowkidar",
+    "garibi hatao",
+    "jumla",
+]
+
+PROMISE_PATTERNS = [
+    r"will (?:give|build|bring|make|provide|create|ensure|double|end|remove|deliver)",
+    r"promis\w*",
+    r"guarantee\w*",
+    r"vaa+d(?:a+|e+|o+n)",
+    r"waa+d(?:a+|e+|o+n)",
+    r"free (?:bijli|electricity|ration|gas|cylinders?|laptops?|wi-?fi|water|pani|bus|travel"
+    r"|education|treatment|healthcare|vaccines?|homes?|houses?)",
+    r"muft\w*",
+    r"har ghar",
+    # Future-tense verbs: karenge, denge, milega, and the -ayenge forms
+    # (hatayenge, layenge, aayenge, banayenge)
+    r"(?:kar|d|l|ban|mil|de|pahunch|bhej|jod|badh|khol|sudhar)(?:enge|egi|ega)",
+    r"\w*ay(?:enge|egi|ega)",
+    r"ho(?:ga|gi|nge)",
+    r"\d+\s*(?:crore|lakh)",
+]
+
+BLAME_TARGETS = {
+    "Opposition": [r"opposition", r"vipaksh", r"unki party", r"virodhi"],
+    "Previous Government": [
+        r"(?:previous|past|earlier) governments?", r"pichli sarkar\w*", r"(?:70|seventy|sattar) saal",
+    ],
+    "Foreign Forces": [r"foreign (?:forces|hand|powers?)", r"videshi", r"bahari tak?kat"],
+    "Media": [
+        r"(?:godi|paid|biased|bikau|fake|lutyens) (?:media|press)", r"media (?:wale|walon|ne|houses?|mafia)",
+        r"news channels?", r"presstitutes?", r"patrakar\w*",
+    ],
+    "Corrupt Officials": [r"corrupt\w*", r"bhrasht\w*", r"babus?"],
+    "System": [r"(?:rotten|broken|purani|purana) (?:system|vyavastha)", r"system ne", r"vyavastha"],
+}
+
+# Common romanised Hindi words, used to estimate the Hinglish mix. Words
+# that are also common English (the, to, log, par, pe, na, tab, ham, ...)
+# are left out so plain English does not count as Hindi.
+HINDI_WORDS = frozenset("""
+    hai hain tha thi ho hoga hogi ka ki ke ko se mein aur bhi nahi nahin
+    kya kyun kaise yeh woh hum humne hamara hamari hamare aap aapka aapki
+    aapke tum unka unki unke apna apni apne sab sabka sabko desh janta
+    sarkar logon bhaiyon behno behnon mitron ji karo karna karenge karega
+    denge diya dena liya raha rahe rahi jo toh kuch bahut abhi jab yahan
+    wahan kabhi hamesha saal garib kisan naujawan
+    """.split())
+
+# Patterns are matched against the lowercased speech, which is much cheaper
+# than re.IGNORECASE over long alternations
+_CATCHPHRASE_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(phrase) for phrase in CATCHPHRASES) + r")\b"
+)
+_PROMISE_RE = re.compile(r"\b(?:" + "|".join(PROMISE_PATTERNS) + r")\b")
+_BLAME_GROUPS = {f"t{i}": target for i, target in enumerate(BLAME_TARGETS)}
+_BLAME_RE = re.compile(
+    r"\b(?:"
+    + "|".join(
+        rf"(?P<{group}>{'|'.join(BLAME_TARGETS[target])})"
+        for group, target in _BLAME_GROUPS.items()
+    )
+    + r")\b"
+)
+_WORD_RE = re.compile(r"[a-z]+")
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+
+
+def _scale(value: float, full_marks_at: float) -> float:
+    """Map a raw count onto a 0-10 score that saturates at full_marks_at"""
+    return round(min(10.0, 10.0 * value / full_marks_at), 1)
+
+
+def analyze_speech(speech: str, blame_target: Optional[str] = None) -> Dict[str, Any]:
+    """Score a speech on the measurable critique categories"""
+    paragraphs = max(1, sum(1 for block in _PARAGRAPH_RE.split(speech) if block.strip()))
+    text = speech.lower()
+
+    catchphrases: Dict[str, int] = {}
+    for match in _CATCHPHRASE_RE.finditer(text):
+        phrase = match.group(0)
+        catchphrases[phrase] = catchphrases.get(phrase, 0) + 1
+
+    promises = sum(1 for _ in _PROMISE_RE.finditer(text))
+
+    blame_mentions = {target: 0 for target in BLAME_TARGETS}
+    for match in _BLAME_RE.finditer(text):
+        blame_mentions[_BLAME_GROUPS[match.lastgroup]] += 1
+    total_blame = sum(blame_mentions.values())
+
+    words = _WORD_RE.findall(text)
+    hindi_words = sum(1 for word in words if word in HINDI_WORDS)
+    hinglish_ratio = hindi_words / len(words) if words else 0.0
+
+    # Blame aimed at the requested target counts double
+    blame_points = total_blame + (blame_mentions.get(blame_target, 0) if blame_target else 0)
+
+    return {
+        "paragraphs": paragraphs,
+        "catchphrases": catchphrases,
+        "promises": promises,
+        "promise_density": round(promises / paragraphs, 2),
+        "blame_mentions": blame_mentions,
+        "hinglish_ratio": round(hinglish_ratio, 3),
+        "scores": {
+            "Jumla Density": _scale(promises / paragraphs, 4),
+            "Blame-Shifting Score": _scale(blame_points, 8),
+            "Catchphrase Usage": _scale(sum(catchphrases.values()), 6),
+            # A balanced mix (around half Hindi) is the most authentic Hinglish
+            "Hinglish Authenticity": round(10.0 * max(0.0, 1 - abs(hinglish_ratio - 0.5) / 0.5), 1),
+        },
+    }
+
+
+def format_local_critique(analysis: Dict[str, Any]) -> str:
+    """Render an analysis as a short critique in place of the LLM one"""
+    lines = [f"- **{name}**: {score}/10" for name, score in analysis["scores"].items()]
+
+    top_phrases = sorted(analysis["catchphrases"].items(), key=lambda item: -item[1])[:3]
+    if top_phrases:
+        lines.append("- **Favourite jumlas**: " + ", ".join(f'"{phrase}" x{count}' for phrase, count in top_phrases))
+
+    blamed = [target for target, count in analysis["blame_mentions"].items() if count]
+    lines.append("- **Blamed**: " + (", ".join(blamed) if blamed else "nobody, surprisingly"))
+    lines.append(
+        f"- **Promises**: {analysis['promises']} across {analysis['paragraphs']} paragraph(s), "
+        f"Hindi share {analysis['hinglish_ratio']:.0%}"
+    )
+    return "### ⚡ Local Jumla-Meter\n\n" + "\n".join(lines)